@@ -6,21 +6,57 @@ This script simulates a typical agent workflow to demonstrate all the different
 UI components and logging capabilities available in the Dexter utils package.
 """
 
+import itertools
+import os
+import sys
 import time
-import random
 from src.terminalapp.utils.ui import UI, show_progress, Colors
-from src.terminalapp.utils.logger import Logger
+from src.terminalapp.utils.logger import Logger, format_kv
 from src.terminalapp.utils.intro import print_intro
 
+# Report how long the demo itself took (implies --fast)
+TIME = "--time" in sys.argv
+
+# Skip simulated delays entirely (for CI/benchmark runs)
+FAST = "--fast" in sys.argv or TIME
+
+# Headless mode: skip the interactive "Press Enter" gates so the demo
+# can run in CI or under a profiler without a human at the keyboard
+PAUSE = (lambda _prompt="": None) if os.environ.get("DEMO_NONINTERACTIVE") else input
+
+# Precomputed delay schedules: deterministic and reproducible across
+# runs, with no PRNG call per event
+_TYPING_DELAYS = itertools.cycle([0.5, 0.8, 1.1, 1.4, 0.7, 1.0])
+_PROCESSING_DELAYS = itertools.cycle([1.0, 1.8, 2.5, 1.4, 2.2])
+
+
+def _section_header(title: str) -> str:
+    """Build a section header string; evaluated once per section below."""
+    return f"\n{Colors.BOLD}{Colors.CYAN}=== {title} ==={Colors.ENDC}\n"
+
+
+# Section headers precomputed at import so each demo run reuses the
+# assembled string instead of rebuilding the f-string per call
+_HDR_BASIC = _section_header("BASIC UI DEMO")
+_HDR_TASKS = _section_header("TASK WORKFLOW DEMO")
+_HDR_PROGRESS = _section_header("PROGRESS CONTEXT DEMO")
+_HDR_TOOLS = _section_header("TOOL EXECUTION DEMO")
+_HDR_USER = _section_header("USER INTERACTION DEMO")
+_HDR_ANSWER = _section_header("FINAL ANSWER DEMO")
+_HDR_LOGGER = _section_header("LOGGER WORKFLOW DEMO")
+_HDR_DECORATOR = _section_header("PROGRESS DECORATOR DEMO")
+
 
 def simulate_typing_delay():
-    """Add a small random delay to simulate realistic interaction timing."""
-    time.sleep(random.uniform(0.5, 1.5))
+    """Add a small delay to simulate realistic interaction timing."""
+    if not FAST:
+        time.sleep(next(_TYPING_DELAYS))
 
 
 def simulate_processing_delay():
     """Add a longer delay to simulate processing time."""
-    time.sleep(random.uniform(1.0, 3.0))
+    if not FAST:
+        time.sleep(next(_PROCESSING_DELAYS))
 
 
 @show_progress("Analyzing financial data...", "Financial analysis complete")
@@ -32,7 +68,7 @@ def simulate_data_analysis():
 
 def demo_basic_ui():
     """Demonstrate basic UI functionality."""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}=== BASIC UI DEMO ==={Colors.ENDC}\n")
+    print(_HDR_BASIC)
     
     ui = UI()
     
@@ -53,7 +89,7 @@ def demo_basic_ui():
 
 def demo_task_workflow():
     """Demonstrate task workflow with UI feedback."""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}=== TASK WORKFLOW DEMO ==={Colors.ENDC}\n")
+    print(_HDR_TASKS)
     
     ui = UI()
     
@@ -79,7 +115,7 @@ def demo_task_workflow():
 
 def demo_progress_context():
     """Demonstrate progress context manager."""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}=== PROGRESS CONTEXT DEMO ==={Colors.ENDC}\n")
+    print(_HDR_PROGRESS)
     
     ui = UI()
     
@@ -102,28 +138,28 @@ def demo_progress_context():
 
 def demo_tool_execution():
     """Demonstrate tool execution logging."""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}=== TOOL EXECUTION DEMO ==={Colors.ENDC}\n")
+    print(_HDR_TOOLS)
     
     ui = UI()
     
     # Simulate tool parameter display and results
     tool_params = {"symbol": "AAPL", "period": "1y", "interval": "1d"}
-    ui.print_tool_params(str(tool_params))
+    ui.print_tool_params(format_kv(tool_params))
     simulate_typing_delay()
-    
+
     tool_result = {
-        "status": "success", 
-        "data_points": 252, 
+        "status": "success",
+        "data_points": 252,
         "last_price": 175.43,
         "volume": 45782190
     }
-    ui.print_tool_run(str(tool_result))
+    ui.print_tool_run(format_kv(tool_result))
     simulate_typing_delay()
 
 
 def demo_user_interaction():
     """Demonstrate user query display."""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}=== USER INTERACTION DEMO ==={Colors.ENDC}\n")
+    print(_HDR_USER)
     
     ui = UI()
     
@@ -141,7 +177,7 @@ def demo_user_interaction():
 
 def demo_final_answer():
     """Demonstrate final answer display."""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}=== FINAL ANSWER DEMO ==={Colors.ENDC}\n")
+    print(_HDR_ANSWER)
     
     ui = UI()
     
@@ -170,7 +206,7 @@ Risk Factors: Market volatility, regulatory concerns, supply chain disruptions."
 
 def demo_logger_workflow():
     """Demonstrate Logger class functionality."""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}=== LOGGER WORKFLOW DEMO ==={Colors.ENDC}\n")
+    print(_HDR_LOGGER)
     
     logger = Logger()
     
@@ -232,13 +268,16 @@ Investment Recommendation: HOLD
 • Monitor Q4 delivery numbers
 
 Risk Level: MODERATE-HIGH"""
-    
+
     logger.log_summary(summary)
+    # Wait for the queued summary to render before main() prompts for
+    # the next section, or the prompt would appear ahead of the box
+    logger.flush()
 
 
 def demo_progress_decorator():
     """Demonstrate the progress decorator."""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}=== PROGRESS DECORATOR DEMO ==={Colors.ENDC}\n")
+    print(_HDR_DECORATOR)
     
     # Use the decorator function we defined earlier
     result = simulate_data_analysis()
@@ -249,6 +288,8 @@ def demo_progress_decorator():
 
 def main():
     """Run all UI and Logger demos."""
+    start = time.perf_counter()
+
     print(f"{Colors.BOLD}{Colors.LIGHT_BLUE}")
     print("╔" + "═" * 60 + "╗")
     print("║" + " " * 15 + "UI & LOGGER DEMO" + " " * 22 + "║") 
@@ -257,29 +298,29 @@ def main():
     
     # Show intro screen
     print_intro()
-    input("Press Enter to start the demo...")
+    PAUSE("Press Enter to start the demo...")
     
     # Run all demos
     demo_basic_ui()
-    input("\nPress Enter to continue to task workflow demo...")
+    PAUSE("\nPress Enter to continue to task workflow demo...")
     
     demo_task_workflow()
-    input("\nPress Enter to continue to progress context demo...")
+    PAUSE("\nPress Enter to continue to progress context demo...")
     
     demo_progress_context()
-    input("\nPress Enter to continue to tool execution demo...")
+    PAUSE("\nPress Enter to continue to tool execution demo...")
     
     demo_tool_execution()
-    input("\nPress Enter to continue to user interaction demo...")
+    PAUSE("\nPress Enter to continue to user interaction demo...")
     
     demo_user_interaction()
-    input("\nPress Enter to continue to final answer demo...")
+    PAUSE("\nPress Enter to continue to final answer demo...")
     
     demo_final_answer()
-    input("\nPress Enter to continue to logger workflow demo...")
+    PAUSE("\nPress Enter to continue to logger workflow demo...")
     
     demo_logger_workflow()
-    input("\nPress Enter to continue to progress decorator demo...")
+    PAUSE("\nPress Enter to continue to progress decorator demo...")
     
     demo_progress_decorator()
     
@@ -295,6 +336,9 @@ def main():
     print("• Logger class integration")
     print(f"• Progress decorators{Colors.ENDC}\n")
 
+    if TIME:
+        print(f"Total demo time: {time.perf_counter() - start:.2f}s")
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
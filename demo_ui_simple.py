@@ -1,19 +1,22 @@
+import os
 import time
 from prompt_toolkit import prompt
 from src.terminalapp.utils.ui import show_progress
 
+# Pre-encoded byte payloads: os.write(1, ...) skips the TextIOWrapper
+# encode/lock/flush chain that print(..., flush=True) pays on every call
+_HIDE_CURSOR_STEP1 = b"\033[?25lStep1"  # Hide cursor + first step text
+_STEP2 = b"Step2..."
+_SHOW_CURSOR = b"\033[?25h"
+
 @show_progress("Planning tasks...", "Tasks planned")
 def func1():
-    print("\033[?25l", end='')  # Hide cursor
-    print("Step1", end='', flush=True)
+    os.write(1, _HIDE_CURSOR_STEP1)
     time.sleep(3)
-    print("Step2...", end='', flush=True)
+    os.write(1, _STEP2)
     time.sleep(3)
-    print("\033[?25h", end='')  # Show cursor
+    os.write(1, _SHOW_CURSOR)
 
 text = prompt("Give me some input: ")
-print(f"You said: {text}", end='', flush=True)
+os.write(1, f"You said: {text}".encode("utf-8"))
 func1()
-
-
-
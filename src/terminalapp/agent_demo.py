@@ -5,9 +5,22 @@ This agent showcases basic UI and Logger functionality with a simple
 interaction pattern: greeting, waiting, and echoing user input.
 """
 
-import time
-from terminalapp.utils.logger import Logger
-from terminalapp.utils.ui import UI
+import os
+import selectors
+import signal
+import string
+import sys
+import threading
+from terminalapp.utils.logger import get_logger
+from terminalapp.utils.ui import get_ui
+
+# Precomputed lookup structures for input analysis: set intersection and
+# str.translate each scan the input once at C level, instead of three
+# Python-level generator passes per message
+_DIGITS = frozenset(string.digits)
+_ALNUM_SPACE_TABLE = str.maketrans(
+    "", "", string.ascii_letters + string.digits + string.whitespace
+)
 
 
 class AgentDemo:
@@ -26,37 +39,95 @@ class AgentDemo:
     """
     
     def __init__(self):
-        """Initialize the simple agent with logger and UI instances."""
-        self.logger = Logger()
-        self.ui = UI()
+        """Initialize the simple agent with the shared logger and UI instances."""
+        self.logger = get_logger()
+        self.ui = get_ui()
+        # Set on Ctrl-C so timed waits end immediately instead of
+        # sleeping out their full duration
+        self._stop = threading.Event()
     
     def greet_user(self):
         """Display a greeting message using the logger."""
         self.logger.log_header("Agent Demo - Simple Interactive Demo")
-        
+        # Drain the queued header before writing to the UI directly, so
+        # the box cannot lose the race against the greeting below
+        self.logger.flush()
+
         # Use UI for a friendly greeting with branding colors
         greeting = "Hello! I'm Agent Demo, a simple interactive assistant."
         self.ui.print_user_query(greeting)  # Uses the same styling as user queries
     
     def wait_with_progress(self):
-        """Wait for 3 seconds with a progress indicator."""
+        """
+        Wait for 3 seconds with a progress indicator.
+
+        Waits on the stop event rather than time.sleep, so a Ctrl-C
+        ends the wait immediately instead of blocking out the full
+        three seconds.
+        """
         with self.logger.progress("Initializing system...", "System ready!"):
-            time.sleep(3.0)
+            self._stop.wait(3.0)
+
+    def _handle_sigint(self, signum, frame):
+        """Signal handler: unblock any timed wait, then interrupt as usual."""
+        self._stop.set()
+        raise KeyboardInterrupt
     
+    # Seconds to wait for user input before giving up
+    INPUT_TIMEOUT = 30.0
+
+    def _read_input(self, prompt: str) -> str:
+        """
+        Read one line from stdin, waiting at most INPUT_TIMEOUT seconds.
+
+        Polls stdin through a selector instead of blocking forever in
+        input(), so an unattended session cannot deadlock the agent.
+        Falls back to plain input() when stdin is not a terminal
+        (e.g. piped input in tests or scripts) and on Windows, where
+        select() only supports sockets, so the selector would raise
+        OSError on a console stdin.
+
+        Args:
+            prompt (str): Prompt text to display before reading
+
+        Returns:
+            str: The line read, without the trailing newline
+
+        Raises:
+            TimeoutError: If no input arrives within INPUT_TIMEOUT seconds
+        """
+        if os.name == "nt" or not sys.stdin.isatty():
+            return input(prompt)
+
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        sel = selectors.DefaultSelector()
+        sel.register(sys.stdin, selectors.EVENT_READ)
+        try:
+            events = sel.select(timeout=self.INPUT_TIMEOUT)
+        finally:
+            sel.close()
+        if not events:
+            raise TimeoutError(f"no input within {self.INPUT_TIMEOUT:.0f} seconds")
+        return sys.stdin.readline().rstrip("\n")
+
     def get_user_input(self):
         """
         Get input from the user and display it back.
-        
+
         Returns:
             str: The user's input text
         """
         # Show an info message about what we're doing
         self.ui.print_info("I'm ready to listen to you!")
-        
+
         # Get user input
         try:
-            user_input = input(f"\n🤖 Please tell me something: ")
+            user_input = self._read_input(f"\n🤖 Please tell me something: ")
             return user_input
+        except TimeoutError:
+            self.ui.print_warning("No input received, continuing without it")
+            return ""
         except KeyboardInterrupt:
             self.ui.print_warning("Input interrupted by user")
             return ""
@@ -75,6 +146,11 @@ class AgentDemo:
             self.ui.print_warning("No input received or input was empty")
             return
         
+        # Analyze the input with single C-level passes instead of
+        # per-character Python loops (matters for large pasted inputs)
+        has_digit = bool(frozenset(user_input) & _DIGITS)
+        has_special = bool(user_input.translate(_ALNUM_SPACE_TABLE))
+
         # Create a formatted response
         response = f"""You said: "{user_input}"
 
@@ -83,11 +159,14 @@ Thank you for sharing that with me! I received your message successfully.
 Input analysis:
 • Length: {len(user_input)} characters
 • Word count: {len(user_input.split())} words
-• Contains numbers: {'Yes' if any(c.isdigit() for c in user_input) else 'No'}
-• Contains special chars: {'Yes' if any(not c.isalnum() and not c.isspace() for c in user_input) else 'No'}"""
+• Contains numbers: {'Yes' if has_digit else 'No'}
+• Contains special chars: {'Yes' if has_special else 'No'}"""
         
-        # Display the response in the prominent answer format
+        # Display the response in the prominent answer format, and wait
+        # for it to render: the caller prints its closing messages with
+        # direct UI calls, which must not overtake the queued answer box
         self.logger.log_summary(response)
+        self.logger.flush()
     
     def run(self):
         """
@@ -99,25 +178,34 @@ Input analysis:
         3. Get user input
         4. Echo back the input with analysis
         """
+        # Route Ctrl-C through our handler so timed waits cancel instantly
+        # (signal handlers can only be installed from the main thread)
+        try:
+            previous_sigint = signal.signal(signal.SIGINT, self._handle_sigint)
+        except ValueError:
+            previous_sigint = None
+
         try:
             # Step 1: Greet the user
             self.greet_user()
-            
+
             # Step 2: Wait for 3 seconds with progress
             self.wait_with_progress()
-            
+
             # Step 3: Get user input
             user_input = self.get_user_input()
-            
+
             # Step 4: Echo back the input
             self.echo_user_input(user_input)
-            
+
             # Final message
             self.ui.print_info("Agent2 interaction complete. Thank you!")
-            
+
         except Exception as e:
             self.ui.print_error(f"Agent2 encountered an error: {e}")
         finally:
+            if previous_sigint is not None:
+                signal.signal(signal.SIGINT, previous_sigint)
             # Always show a final goodbye
             print(f"\n👋 Goodbye from Agent2!\n")
 
@@ -6,11 +6,8 @@ Provides agent selection and interactive capabilities using the UI and Logger sy
 
 from terminalapp.agent_demo import AgentDemo
 from terminalapp.utils.intro import print_intro
-from terminalapp.utils.ui import UI
-from terminalapp.utils.logger import Logger
-from prompt_toolkit import PromptSession
-from prompt_toolkit.history import InMemoryHistory
-
+from terminalapp.utils.ui import get_ui
+from terminalapp.utils.logger import get_logger
 
 
 def run_simple_agent():
@@ -21,9 +18,9 @@ def run_simple_agent():
 
 def main():
     """Main CLI entry point with agent selection."""
-    # Initialize UI and Logger for CLI interactions
-    ui = UI()
-    logger = Logger()
+    # Shared UI and Logger instances for CLI interactions
+    ui = get_ui()
+    logger = get_logger()
     
     # Show intro screen
     print_intro()
@@ -1,36 +1,102 @@
-from pyfiglet import Figlet
+import functools
+import os
+import sys
+from importlib import metadata
+from pathlib import Path
+
+# ANSI color codes
+LIGHT_BLUE = "\033[94m"
+RESET = "\033[0m"
+BOLD = "\033[1m"
+
+# Banner parameters; both are baked into the cache filename
+_BANNER_TEXT = "HELLO"
+#_BANNER_FONT = 'isometric1'
+_BANNER_FONT = '3D-ASCII'
+#_BANNER_FONT = 'univers'
+
+# Welcome box, precomputed once at import (the text never changes)
+_BOX_WIDTH = 80
+_WELCOME_TEXT = "Welcome to this app"
+_PADDING = (_BOX_WIDTH - len(_WELCOME_TEXT) - 2) // 2
+_WELCOME_BOX = (
+    f"{LIGHT_BLUE}{'═' * _BOX_WIDTH}{RESET}\n"
+    f"{LIGHT_BLUE}║{' ' * _PADDING}{BOLD}{_WELCOME_TEXT}{RESET}"
+    f"{LIGHT_BLUE}{' ' * (_BOX_WIDTH - len(_WELCOME_TEXT) - _PADDING - 2)}║{RESET}\n"
+    f"{LIGHT_BLUE}{'═' * _BOX_WIDTH}{RESET}\n"
+)
+
+# Everything around the banner, pre-encoded so print_intro can emit the
+# whole screen with a single write() syscall instead of ~20 prints
+_INTRO_HEAD = ("\n" * 3 + _WELCOME_BOX + "\n").encode("utf-8")
+_INTRO_TAIL = (
+    "Your AI assistant for everything.\n"
+    "Ask me any questions. Type 'exit' or 'quit' to end.\n\n"
+).encode("utf-8")
+
+
+def _banner_cache_path() -> Path:
+    """
+    Path of the cached pre-rendered banner.
+
+    The pyfiglet version is part of the filename so a package upgrade
+    (which may change font rendering) invalidates the cache without any
+    explicit check — and without importing pyfiglet on the fast path.
+    """
+    try:
+        version = metadata.version("pyfiglet")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_root / "terminalapp" / f"intro_{_BANNER_TEXT}_{_BANNER_FONT}_{version}.ansi"
+
+
+@functools.lru_cache(maxsize=8)
+def _figlet(font: str):
+    """
+    Memoized Figlet instance for a font.
+
+    pyfiglet re-parses the .flf font file on every Figlet() construction;
+    caching the instance pays the parse once per font per process.
+    """
+    from pyfiglet import Figlet
+
+    return Figlet(font=font)
+
+
+def _render_banner() -> str:
+    """Render the ASCII-art banner with the color codes baked into each line."""
+    ascii_art = _figlet(_BANNER_FONT).renderText(_BANNER_TEXT)
+    # Wrap every line in color codes with one C-level replace pass instead
+    # of a Python loop over the ~20 banner lines
+    return LIGHT_BLUE + ascii_art.replace("\n", f"{RESET}\n{LIGHT_BLUE}") + RESET + "\n"
+
+
+def _banner() -> bytes:
+    """
+    Return the banner bytes, rendering through pyfiglet only on a cache miss.
+
+    Figlet font parsing dominates cold-start time for a banner that never
+    changes, so the fully colored render is persisted to the user cache
+    directory and replayed directly on subsequent launches.
+    """
+    cache_path = _banner_cache_path()
+    try:
+        return cache_path.read_bytes()
+    except OSError:
+        pass
+
+    banner = _render_banner().encode("utf-8")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(banner)
+    except OSError:
+        pass  # Cache is best-effort; render fresh next time
+    return banner
+
 
 def print_intro():
     """Display the welcome screen with ASCII art."""
-    # ANSI color codes
-    LIGHT_BLUE = "\033[94m"
-    RESET = "\033[0m"
-    BOLD = "\033[1m"
-    
-    # Clear screen effect with some spacing
-    print("\n" * 2)
-    
-    # Welcome box with light blue border
-    box_width = 80
-    welcome_text = "Welcome to this app"
-    padding = (box_width - len(welcome_text) - 2) // 2
-    
-    print(f"{LIGHT_BLUE}{'═' * box_width}{RESET}")
-    print(f"{LIGHT_BLUE}║{' ' * padding}{BOLD}{welcome_text}{RESET}{LIGHT_BLUE}{' ' * (box_width - len(welcome_text) - padding - 2)}║{RESET}")
-    print(f"{LIGHT_BLUE}{'═' * box_width}{RESET}")
-    print()
-    
-    # Create 3D ASCII art using pyfiglet
-    #f = Figlet(font='isometric1')
-    f = Figlet(font='3D-ASCII')
-    #f = Figlet(font='univers')
-    ascii_art = f.renderText('HELLO')
-    
-    # Print the ASCII art in light blue
-    for line in ascii_art.split('\n'):
-        print(f"{LIGHT_BLUE}{line}{RESET}")
-    
-    print("Your AI assistant for everything.")
-    print("Ask me any questions. Type 'exit' or 'quit' to end.")
-    print()
-
+    # Spacing, welcome box, cached banner and footer in one buffered write
+    sys.stdout.buffer.write(_INTRO_HEAD + _banner() + _INTRO_TAIL)
+    sys.stdout.flush()
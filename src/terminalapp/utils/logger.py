@@ -1,132 +1,428 @@
 """
-Logger module 
+Logger module
 
 This module provides a logging interface that wraps the UI system to provide
 consistent, formatted output for different types of agent activities and states.
+
+Log records are not written synchronously: callers enqueue lightweight
+(kind, args) records into a bounded queue, and a single background daemon
+thread drains the queue and performs the actual terminal I/O. This keeps the
+agent's hot path free of blocking writes when stdout is a slow pipe
+(tmux, ssh, journald).
 """
 
-from terminalapp.utils.ui import UI
+import atexit
+import itertools
+import queue
+import sys
+import threading
+import time
+from collections import deque
+
+from terminalapp.utils.ui import get_ui
+
+try:
+    import orjson  # C-level JSON serializer, much faster than dict repr
+except ImportError:
+    orjson = None
+
+
+def format_kv(data) -> str:
+    """
+    Serialize a tool parameter/result value for display.
+
+    Dicts are rendered with orjson when it is installed — a C extension
+    roughly an order of magnitude faster than dict.__repr__, and its
+    output is valid JSON for later machine parsing. Without orjson, or
+    for values it cannot serialize, dicts fall back to comma-joined
+    key=value pairs and everything else to str().
+
+    Args:
+        data: The value to format, typically a dict of tool parameters
+
+    Returns:
+        str: The formatted representation
+    """
+    if isinstance(data, dict):
+        if orjson is not None:
+            try:
+                return orjson.dumps(data).decode()
+            except TypeError:
+                pass  # Non-JSON-serializable value; use the plain formatter
+        return ", ".join(f"{k}={v}" for k, v in data.items())
+    return str(data)
 
 
 class Logger:
     """
     Logger that uses the interactive UI system for formatted output.
-    
+
     This class acts as a bridge between the agent's logging needs and the UI system,
     providing semantic methods for different types of log messages while maintaining
     a consistent visual style throughout the application.
-    
+
+    Log calls enqueue records into a bounded queue drained by a background
+    writer thread, so callers never block on terminal I/O. When the queue is
+    full the oldest record is dropped rather than stalling the caller.
+
     Attributes:
         ui (UI): The UI instance used for formatted output
-        log (list): Internal log storage for message history
+        log (deque): Ring buffer of recent messages (HISTORY_SIZE entries)
     """
-    
+
+    # Maximum number of records buffered before the oldest is dropped
+    QUEUE_SIZE = 10_000
+
+    # Ring-buffer capacity of the in-memory message history
+    HISTORY_SIZE = 10_000
+
+    # Batching policy for plain messages: flush once the pending buffer
+    # reaches FLUSH_BYTES or FLUSH_INTERVAL seconds after the first
+    # unflushed message, whichever comes first
+    FLUSH_BYTES = 4096
+    FLUSH_INTERVAL = 0.05
+
+    # Maximum records rendered per drain pass; the batch grows with the
+    # backlog, up to this cap, and shrinks to one under light load
+    MAX_BATCH = 128
+
     def __init__(self):
-        """Initialize the logger with a UI instance and empty log storage."""
-        self.ui = UI()
-        self.log = []  # Store log messages for potential later retrieval
+        """Initialize the logger with the shared UI and start the writer thread."""
+        self.ui = get_ui()
+        # Bounded message history: a long-running agent would otherwise
+        # accumulate every log line in RAM with no eviction
+        self.log = deque(maxlen=self.HISTORY_SIZE)
+
+        # Map record kinds to the method that renders them on the writer
+        # thread ("msg" and "flush" records are handled inline in _drain)
+        self._handlers = {
+            "header": self.ui.print_header,
+            "user_query": self.ui.print_user_query,
+            "task_list": self.ui.print_task_list,
+            "task_list_strs": self.ui.print_task_list_strs,
+            "task_list_dicts": self.ui.print_task_list_dicts,
+            "task_start": self.ui.print_task_start,
+            "task_done": self.ui.print_task_done,
+            "tool_run": self._print_tool_run,
+            "warning": self.ui.print_warning,
+            "summary": self.ui.print_answer,
+        }
+
+        # Bounded queue + single daemon writer thread: callers only enqueue
+        self._q = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._writer = threading.Thread(target=self._drain, daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+        atexit.register(self.flush)
+
+    def _enqueue(self, kind: str, *args):
+        """
+        Enqueue a log record without blocking the caller.
+
+        When the queue is full, the oldest record is dropped to make room,
+        so the hot path never stalls for more than one slot.
+
+        Args:
+            kind (str): The record type, keyed into the handler table
+            *args: Arguments forwarded to the rendering handler
+        """
+        record = (kind, args)
+        while True:
+            try:
+                self._q.put_nowait(record)
+                return
+            except queue.Full:
+                # Drop-oldest policy: evict one record and retry
+                try:
+                    self._q.get_nowait()
+                    self._q.task_done()
+                except queue.Empty:
+                    pass
+
+    def _drain(self):
+        """
+        Writer thread loop: pull records off the queue and render them.
+
+        Plain messages are not written one by one: they accumulate in a
+        pending buffer that is flushed as a single stdout write once it
+        holds FLUSH_BYTES of text, once FLUSH_INTERVAL has elapsed since
+        the first unflushed message, or whenever a formatted record must
+        be rendered (to keep output ordered).
+
+        Runs until a None sentinel is received from close(). All terminal
+        I/O happens here, on a single thread, preserving record order.
+        """
+        pending = deque()
+        pending_bytes = 0
+        deadline = None  # Monotonic time of the next timed flush, if any
+
+        def report_failure(kind, exc):
+            # Last-resort channel: the record is lost, but the writer
+            # thread must survive, so say what happened on stderr
+            try:
+                sys.stderr.write(f"logger: dropped {kind} record: {exc!r}\n")
+            except Exception:
+                pass
+
+        def flush_pending():
+            nonlocal pending_bytes, deadline
+            if pending:
+                try:
+                    # writelines lets TextIOWrapper fuse the batch into one
+                    # buffer copy without a joined intermediate string
+                    sys.stdout.writelines(pending)
+                    sys.stdout.flush()
+                except Exception as exc:  # e.g. BrokenPipeError under head
+                    report_failure("msg", exc)
+                # Cleared even on failure, so a dead stdout cannot grow
+                # the buffer without bound
+                pending.clear()
+            pending_bytes = 0
+            deadline = None
+
+        while True:
+            try:
+                if deadline is None:
+                    record = self._q.get()
+                else:
+                    record = self._q.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                # Timed flush: no new records before the deadline
+                flush_pending()
+                continue
+
+            # Adaptive batching: also grab whatever is already queued, up
+            # to MAX_BATCH records, and render the whole batch in one pass
+            batch = [record]
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopping = False
+            for record in batch:
+                if record is None:
+                    flush_pending()
+                    self._q.task_done()
+                    stopping = True
+                    break
+                kind, args = record
+                try:
+                    if kind == "msg":
+                        pending.append(args[0] + "\n")
+                        pending_bytes += len(args[0]) + 1
+                        if deadline is None:
+                            deadline = time.monotonic() + self.FLUSH_INTERVAL
+                        if pending_bytes >= self.FLUSH_BYTES:
+                            flush_pending()
+                    elif kind == "flush":
+                        flush_pending()
+                    else:
+                        # Formatted records write directly; flush buffered
+                        # messages first so ordering is preserved
+                        flush_pending()
+                        self._handlers[kind](*args)
+                except Exception as exc:
+                    # One bad record (render error, broken pipe, bad
+                    # argument) must not kill the drain loop — that
+                    # would silently drop all output for the rest of
+                    # the process and turn flush() into a no-op
+                    report_failure(kind, exc)
+                finally:
+                    self._q.task_done()
+            if stopping:
+                break
+
+            # Low-latency path: the queue emptied before MAX_BATCH, so
+            # write the batch out now instead of waiting for the timer
+            if pending and self._q.empty():
+                flush_pending()
+
+    def _print_tool_run(self, params: str, result: str):
+        """Render a tool execution record (writer-thread side of log_tool_run)."""
+        self.ui.print_tool_block(params, result)
+
+    def flush(self):
+        """
+        Force out any batched messages and wait until everything queued
+        so far has been rendered.
+        """
+        if self._writer.is_alive():
+            self._enqueue("flush")
+            self._q.join()
+
+    def close(self):
+        """
+        Stop the writer thread after draining all pending records.
+
+        Registered with atexit so buffered records are flushed to the
+        terminal before interpreter shutdown. Safe to call more than once.
+        """
+        if self._writer.is_alive():
+            self._q.put(None)  # Sentinel: drain everything queued so far, then exit
+            self._writer.join(timeout=2.0)
 
     def _log(self, msg: str):
         """
-        Print a message immediately and store it in the log history.
-        
+        Enqueue a message for output and store it in the log history.
+
         Args:
             msg (str): The message to print and store
         """
-        print(msg, flush=True)  # Immediate output with buffer flush
+        self._enqueue("msg", msg)
         self.log.append(msg)    # Store for history
 
+    def enable_unbounded(self):
+        """
+        Switch the message history from the ring buffer to a plain list.
+
+        For callers that genuinely need the full history, at the cost of
+        memory growing with runtime length.
+        """
+        self.log = list(self.log)
+
+    def tail(self, n: int):
+        """
+        Return the most recent n messages from the history.
+
+        Args:
+            n (int): Number of trailing messages to return
+
+        Returns:
+            list: The last n messages, oldest first
+        """
+        return list(itertools.islice(self.log, max(0, len(self.log) - n), len(self.log)))
+
     def log_header(self, msg: str):
         """
         Log a section header using the UI formatting.
-        
+
         Args:
             msg (str): The header text to display
         """
-        self.ui.print_header(msg)
-    
+        self._enqueue("header", msg)
+
     def log_user_query(self, query: str):
         """
         Log a user query with appropriate formatting and styling.
-        
+
         Args:
             query (str): The user's query text
         """
-        self.ui.print_user_query(query)
+        self._enqueue("user_query", query)
 
     def log_task_list(self, tasks):
         """
         Log a list of planned tasks in a formatted display.
-        
+
+        The element types are inspected once here: homogeneous lists go
+        to the specialized formatters (all-strings keeps its
+        zero-dispatch join), anything mixed falls back to the generic
+        per-item formatter.
+
         Args:
-            tasks: List of task objects or task descriptions to display
+            tasks: Iterable of task dicts or task description strings
         """
-        self.ui.print_task_list(tasks)
+        # Materialize first: inspecting a generator would consume its
+        # leading element before the formatter ever saw it
+        tasks = list(tasks)
+        first = tasks[0] if tasks else None
+        if isinstance(first, dict):
+            kind = "task_list_dicts"  # Tolerates stray non-dict items
+        elif all(type(task) is str for task in tasks):
+            kind = "task_list_strs"
+        else:
+            kind = "task_list"
+        self._enqueue(kind, tasks)
 
     def log_task_start(self, task_desc: str):
         """
         Log the start of a task with visual indicators.
-        
+
         Args:
             task_desc (str): Description of the task being started
         """
-        self.ui.print_task_start(task_desc)
+        self._enqueue("task_start", task_desc)
 
     def log_task_done(self, task_desc: str):
         """
         Log the completion of a task with success indicators.
-        
+
         Args:
             task_desc (str): Description of the completed task
         """
-        self.ui.print_task_done(task_desc)
-        
+        self._enqueue("task_done", task_desc)
+
     def log_tool_run(self, params: dict, result: dict):
         """
         Log the execution of a tool with its parameters and results.
-        
+
         Args:
             params (dict): The parameters passed to the tool
             result (dict): The result returned by the tool
         """
-        self.ui.print_tool_params(str(params))
-        self.ui.print_tool_run(str(result))
+        self._enqueue("tool_run", format_kv(params), format_kv(result))
 
     def log_risky(self, tool: str, input_str: str):
         """
         Log potentially risky actions that were auto-confirmed.
-        
+
         This method is used to alert users when the system performs
         actions that could have side effects or security implications.
-        
+
         Args:
             tool (str): Name of the tool being executed
             input_str (str): Input parameters for the risky action
         """
-        self.ui.print_warning(f"Risky action {tool}({input_str}) — auto-confirmed")
+        self._enqueue("warning", f"Risky action {tool}({input_str}) — auto-confirmed")
 
     def log_summary(self, summary: str):
         """
         Log a final summary or answer in a prominent display box.
-        
+
         Args:
             summary (str): The summary text to display prominently
         """
-        self.ui.print_answer(summary)
-    
+        self._enqueue("summary", summary)
+
     def progress(self, message: str, success_message: str = ""):
         """
         Return a progress context manager for showing loading states.
-        
+
         This method provides a context manager that displays a spinner
         while long-running operations execute, with automatic cleanup
         and success/failure messaging.
-        
+
+        Pending log records are drained first so queued output never
+        interleaves with the spinner animation.
+
         Args:
             message (str): The message to show during progress
             success_message (str): Optional success message to show on completion
-            
+
         Returns:
             Context manager that handles spinner lifecycle
         """
+        self.flush()
         return self.ui.progress(message, success_message)
+
+
+# Process-wide shared Logger instance, created lazily by get_logger()
+_default_logger = None
+
+
+def get_logger() -> Logger:
+    """
+    Return the shared Logger instance, creating it on first use.
+
+    Sharing one Logger keeps a single writer thread and a unified
+    message history across all components of the application.
+
+    Returns:
+        Logger: The process-wide Logger instance
+    """
+    global _default_logger
+    if _default_logger is None:
+        _default_logger = Logger()
+    return _default_logger
@@ -6,10 +6,14 @@ formatted output for creating a professional command-line interface. It includes
 spinner animations, progress indicators, and styled message formatting.
 """
 
+import itertools
+import os
 import sys
+import textwrap
 import time
 import threading
-from contextlib import contextmanager
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
 from typing import Optional, Callable
 from functools import wraps
 
@@ -33,30 +37,123 @@ class Colors:
     WHITE = "\033[97m"       # Bright white
     LIGHT_BLUE = "\033[94m"  # Light blue matching DEXTER ASCII art theme
 
+    # Byte twins of the codes above, for the byte-level render paths
+    # (spinner frames). Encoded once here at import so hot loops never
+    # call str.encode per write.
+    B_BLUE = b"\033[94m"
+    B_CYAN = b"\033[96m"
+    B_GREEN = b"\033[92m"
+    B_YELLOW = b"\033[93m"
+    B_RED = b"\033[91m"
+    B_MAGENTA = b"\033[95m"
+    B_ENDC = b"\033[0m"
+    B_BOLD = b"\033[1m"
+    B_DIM = b"\033[2m"
+    B_WHITE = b"\033[97m"
+    B_LIGHT_BLUE = b"\033[94m"
+
+
+# Frame writer, selected once at import. POSIX terminals take the raw
+# os.write(1, ...) fast path; on Windows ANSI handling lives in the
+# TextIOWrapper/colorama layer, which writes to fd 1 would bypass, so
+# frames go through sys.stdout there instead
+if os.name == "nt":
+    def _write_frame(payload: bytes):
+        sys.stdout.write(payload.decode("utf-8"))
+        sys.stdout.flush()
+else:
+    def _write_frame(payload: bytes):
+        os.write(1, payload)
+
+
+class _SpinnerRenderer:
+    """
+    Single shared background thread that ticks every active Spinner.
+
+    One process-wide renderer replaces a thread per Spinner: starting a
+    spinner registers it here, stopping unregisters it. The thread is
+    created lazily on the first registration and idles on a condition
+    variable while no spinners are active, so an application that shows
+    hundreds of short-lived spinners pays one thread creation total and
+    zero CPU between them.
+    """
+
+    # Seconds between animation ticks (~12 FPS), shared by all spinners
+    INTERVAL = 0.08
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._active = []
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, spinner: "Spinner"):
+        """Add a spinner to the tick list, starting the thread if needed."""
+        with self._cond:
+            if spinner not in self._active:
+                self._active.append(spinner)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def unregister(self, spinner: "Spinner"):
+        """Remove a spinner from the tick list; safe to call twice."""
+        with self._cond:
+            try:
+                self._active.remove(spinner)
+            except ValueError:
+                pass
+            self._cond.notify()
+
+    def _run(self):
+        """Renderer loop: tick all active spinners, idle when there are none."""
+        while True:
+            with self._cond:
+                while not self._active:
+                    self._cond.wait()  # Idle at zero CPU until a registration
+                spinners = list(self._active)
+            deadline = time.monotonic() + self.INTERVAL
+            for spinner in spinners:
+                spinner._tick()
+            # Sleep out the remainder of the tick on the condition so a
+            # register/unregister wakes the loop immediately; when a tick
+            # overran its slot, loop straight into the next one
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                with self._cond:
+                    self._cond.wait(delay)
+
+
+# Process-wide renderer shared by every Spinner instance
+_renderer = _SpinnerRenderer()
+
 
 class Spinner:
     """
-    An animated spinner that runs in a separate thread for progress indication.
-    
+    An animated spinner for progress indication.
+
     Uses Unicode braille patterns to create a smooth spinning animation
-    while long-running operations execute. Thread-safe and designed to
-    provide visual feedback without blocking the main thread.
-    
+    while long-running operations execute. All spinners are animated by
+    one shared background renderer thread (see _SpinnerRenderer), so
+    starting a spinner never creates a thread of its own.
+
     Attributes:
         FRAMES (list): Unicode braille patterns for animation frames
         message (str): Text displayed alongside the spinner
         color (str): ANSI color code for the spinner
         running (bool): Flag to control animation state
-        thread (Optional[threading.Thread]): Background animation thread
     """
     
     # Unicode braille patterns create smooth spinning effect
     FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-    
+
+    # Frames pre-encoded once for the byte-level write path
+    _FRAMES_B = [f.encode("utf-8") for f in FRAMES]
+
     def __init__(self, message: str = "", color: str = Colors.CYAN):
         """
         Initialize a new spinner instance.
-        
+
         Args:
             message (str): Text to display next to the spinner
             color (str): ANSI color code for spinner styling
@@ -65,40 +162,132 @@ class Spinner:
         self.color = color
         self.running = False
         self.thread: Optional[threading.Thread] = None
-        
-    def _animate(self):
+        # Animation is pointless (and noisy: every frame lands as a
+        # separate line of \r-garbage) when output is piped to a file or
+        # another process, so it is disabled entirely off-terminal
+        try:
+            self._is_tty = sys.stdout.isatty()
+        except Exception:
+            self._is_tty = False
+        # Set by stop() or by the caller's completion event; the
+        # animation loop waits on it so both end the animation instantly
+        self._stop_event = threading.Event()
+        # Fixed parts of each frame, encoded once; the animation loop
+        # assembles frames from bytes and never re-encodes text
+        self._lock = threading.Lock()
+        self._msg_b = message.encode("utf-8")
+        self._prefix = b"\r" + color.encode("utf-8")
+        self._suffix = Colors.B_ENDC + b" "
+        self._last = b""  # Last payload written; identical frames are skipped
+        # Per-spinner frame iterator, reset by start(); itertools.cycle
+        # iterates the frames at C level with no index bookkeeping
+        self._frames = itertools.cycle(self._FRAMES_B)
+
+    def _tick(self):
         """
-        Internal animation loop that runs in a separate thread.
-        
-        Cycles through spinner frames at a consistent rate, updating
-        the terminal display in-place to create animation effect.
-        """
-        idx = 0
-        while self.running:
-            frame = self.FRAMES[idx % len(self.FRAMES)]
-            # Write spinner frame and message, overwriting previous line
-            sys.stdout.write(f"\r{self.color}{frame}{Colors.ENDC} {self.message}")
-            sys.stdout.flush()
-            time.sleep(0.08)  # ~12 FPS for smooth animation
-            idx += 1
-    
-    def start(self):
+        Render one animation frame (called by the shared renderer thread).
+
+        Each frame is one os.write of pre-encoded bytes — a single
+        syscall, bypassing the TextIOWrapper encode/lock/flush chain.
+        Once the stop/completion event is set the spinner drops out of
+        the renderer's tick list instead of drawing stale frames.
+
+        The whole tick runs under the spinner's lock, paired with
+        stop(): a stop() in progress waits out an in-flight frame
+        write, and a tick that starts after stop() sees running=False
+        before writing — so no frame can land after the line is
+        cleared.
+        """
+        with self._lock:
+            if not self.running or self._stop_event.is_set():
+                _renderer.unregister(self)
+                return
+            # Write spinner frame and message, overwriting previous line;
+            # skip the write entirely when nothing on screen would change
+            payload = self._prefix + next(self._frames) + self._suffix + self._msg_b
+            if payload != self._last:
+                _write_frame(payload)
+                self._last = payload
+
+    def start(self, done: Optional[threading.Event] = None):
         """
-        Start the spinner animation in a background thread.
-        
-        Creates and starts a daemon thread to handle animation,
-        ensuring it won't prevent program exit.
+        Start the spinner animation on the shared renderer thread.
+
+        Registers with the process-wide _SpinnerRenderer instead of
+        creating a thread per spinner; the renderer thread is a daemon,
+        so it won't prevent program exit.
+
+        Args:
+            done (Optional[threading.Event]): Completion event the real work
+                signals when it finishes. The animation stops as soon as the
+                event is set, instead of spinning until the next timer wakeup.
         """
-        if not self.running:
-            self.running = True
-            self.thread = threading.Thread(target=self._animate, daemon=True)
-            self.thread.start()
+        if self.running:
+            return
+        if not self._is_tty:
+            # Redirected output: state the message once, no animation,
+            # zero background CPU, clean line-oriented logs
+            if self.message:
+                print(f"{self.color}{self.message}{Colors.ENDC}")
+            return
+        self.running = True
+        self._stop_event = done or threading.Event()
+        self._frames = itertools.cycle(self._FRAMES_B)
+        self._last = b""
+        # Drain Python-level stdout buffering before the raw byte
+        # writes so frames cannot overtake earlier printed text
+        sys.stdout.flush()
+        _renderer.register(self)
     
+    async def _animate_async(self):
+        """
+        Asyncio flavor of the animation loop.
+
+        Identical rendering to _animate, but ticks on asyncio.sleep in
+        the caller's event loop instead of a dedicated thread.
+        """
+        import asyncio
+
+        for frame in itertools.cycle(self._FRAMES_B):
+            if not self.running or self._stop_event.is_set():
+                break
+            payload = self._prefix + frame + self._suffix + self._msg_b
+            if payload != self._last:
+                _write_frame(payload)
+                self._last = payload
+            await asyncio.sleep(0.08)
+
+    def start_async(self):
+        """
+        Start the spinner as an asyncio task instead of a thread.
+
+        For callers already running an event loop this skips the native
+        thread creation (and its GIL handoff jitter) that start() pays
+        per spinner — worthwhile when progress wraps many sub-second
+        operations. stop() works unchanged.
+
+        Returns:
+            asyncio.Task: The animation task, or None if already running
+        """
+        import asyncio
+
+        if self.running:
+            return None
+        if not self._is_tty:
+            if self.message:
+                print(f"{self.color}{self.message}{Colors.ENDC}")
+            return None
+        self.running = True
+        self._stop_event = threading.Event()
+        self.thread = None  # Animated by the event loop, not the renderer
+        sys.stdout.flush()
+        return asyncio.get_running_loop().create_task(self._animate_async())
+
     def stop(self, final_message: str = "", symbol: str = "✓", symbol_color: str = Colors.GREEN):
         """
         Stop the spinner and optionally show a completion message.
         
-        Cleanly shuts down the animation thread, clears the spinner line,
+        Unregisters from the shared renderer, clears the spinner line,
         and optionally displays a final status message with symbol.
         
         Args:
@@ -106,12 +295,23 @@ class Spinner:
             symbol (str): Symbol to show (default: checkmark for success)
             symbol_color (str): Color for the symbol
         """
+        if not self._is_tty:
+            # No spinner line to erase; just report the outcome
+            if final_message:
+                print(f"{symbol_color}{symbol}{Colors.ENDC} {final_message}")
+            return
         if self.running:
-            self.running = False
-            if self.thread:
-                self.thread.join()  # Wait for animation thread to finish
-            # Clear the spinner line by overwriting with spaces
-            sys.stdout.write("\r" + " " * (len(self.message) + 10) + "\r")
+            # Taking the tick lock waits out an in-flight frame write,
+            # so the clear below is guaranteed to be the last thing on
+            # the spinner line (the baseline's thread.join guarantee)
+            with self._lock:
+                self.running = False
+                self._stop_event.set()  # No further frames will be drawn
+                # Clear the spinner line with erase-to-EOL: the terminal
+                # does the clearing, in constant bytes regardless of
+                # message length
+                sys.stdout.write("\r\033[K")
+            _renderer.unregister(self)  # Wakes the renderer immediately
             if final_message:
                 print(f"{symbol_color}{symbol}{Colors.ENDC} {final_message}")
             sys.stdout.flush()
@@ -119,11 +319,73 @@ class Spinner:
     def update_message(self, message: str):
         """
         Update the spinner message while it's running.
-        
+
         Args:
             message (str): New message to display with the spinner
         """
+        if message == self.message:
+            return  # Nothing changed; skip the re-encode
         self.message = message
+        with self._lock:
+            self._msg_b = message.encode("utf-8")
+
+    def _reset(self, message: str, color: str):
+        """
+        Re-initialize a recycled spinner for a new run (pool-side API).
+
+        Restores every per-run field that __init__ sets, so an instance
+        handed out by _SpinnerPool.acquire is indistinguishable from a
+        freshly constructed one.
+        """
+        self.message = message
+        self.color = color
+        self.running = False
+        self.thread = None
+        self._stop_event = threading.Event()
+        self._msg_b = message.encode("utf-8")
+        self._prefix = b"\r" + color.encode("utf-8")
+        self._last = b""
+        self._frames = itertools.cycle(self._FRAMES_B)
+
+
+class _SpinnerPool:
+    """
+    Pool of idle Spinner instances for the high-churn progress paths.
+
+    UI.progress creates a spinner per context entry; under many short
+    operations that means an allocation, several str.encode calls and an
+    Event per entry. The pool recycles a small number of instances
+    instead: acquire() pops an idle spinner (or constructs one when the
+    pool is empty) and release() returns it, capped so a burst of
+    concurrent spinners cannot pin memory.
+    """
+
+    # Idle instances kept around; beyond this, released spinners are
+    # simply dropped for the GC
+    MAX_IDLE = 8
+
+    def __init__(self):
+        self._idle = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self, message: str = "", color: str = Colors.CYAN) -> Spinner:
+        """Return a ready-to-start spinner, recycled when one is idle."""
+        with self._lock:
+            spinner = self._idle.pop() if self._idle else None
+        if spinner is None:
+            return Spinner(message, color)
+        spinner._reset(message, color)
+        return spinner
+
+    def release(self, spinner: Spinner):
+        """Return a stopped spinner to the pool."""
+        with self._lock:
+            if len(self._idle) < self.MAX_IDLE:
+                self._idle.append(spinner)
+
+
+# Process-wide pool used by the UI progress contexts
+_spinner_pool = _SpinnerPool()
 
 
 def show_progress(message: str, success_message: str = ""):
@@ -146,6 +408,11 @@ def show_progress(message: str, success_message: str = ""):
             # Long-running operation
             time.sleep(5)
     """
+    # Success text or the progress message converted to past tense —
+    # fixed for the lifetime of the decorated function, so computed here
+    # at decoration time rather than on every call
+    default_success = success_message or message.replace("...", " ✓")
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -153,9 +420,7 @@ def show_progress(message: str, success_message: str = ""):
             spinner.start()
             try:
                 result = func(*args, **kwargs)
-                # Show success message or convert progress message to success
-                success_msg = success_message or message.replace("...", " ✓")
-                spinner.stop(success_msg, symbol="✓", symbol_color=Colors.GREEN)
+                spinner.stop(default_success, symbol="✓", symbol_color=Colors.GREEN)
                 return result
             except Exception as e:
                 # Show failure message with error details
@@ -165,6 +430,55 @@ def show_progress(message: str, success_message: str = ""):
     return decorator
 
 
+# Pre-assembled ANSI templates for the fixed-shape print_* output.
+# The constant parts are concatenated once at import, so each call is a
+# single string concatenation and a single stdout write.
+_HDR_PREFIX = f"\n{Colors.BOLD}{Colors.BLUE}╭─ "
+_HDR_SUFFIX = f"{Colors.ENDC}\n"
+_USER_PREFIX = f"\n{Colors.BOLD}{Colors.LIGHT_BLUE}You: "
+_USER_SUFFIX = f"{Colors.ENDC}\n\n"
+_TASK_START_PREFIX = f"\n{Colors.BOLD}{Colors.CYAN}▶ Task:{Colors.ENDC} "
+_TASK_DONE_PREFIX = f"{Colors.GREEN}  ✓ Completed{Colors.ENDC} {Colors.DIM}│ "
+_TASK_DONE_SUFFIX = f"{Colors.ENDC}\n"
+_TOOL_PARAMS_PREFIX = f"  {Colors.MAGENTA}→{Colors.ENDC}  Parameters: "
+_TOOL_RUN_PREFIX = f"  {Colors.YELLOW}⚡{Colors.ENDC} Result: "
+_TOOL_RUN_EMPTY = _TOOL_RUN_PREFIX + "\n"
+_DIM_OPEN = f" {Colors.DIM}"
+_DIM_CLOSE = Colors.ENDC
+_INFO_PREFIX = Colors.DIM
+_INFO_SUFFIX = f"{Colors.ENDC}\n"
+_ERROR_PREFIX = f"{Colors.RED}✗ Error:{Colors.ENDC} "
+_WARNING_PREFIX = f"{Colors.YELLOW}⚠ Warning:{Colors.ENDC} "
+
+# Horizontal border runs are constant for the fixed box widths; build
+# them once instead of multiplying strings on every call
+_BORDER_H80 = "═" * 78
+_BORDER_TASK = "─" * 50
+
+
+# Fixed lead-in of every task-list row (border, planned-task marker)
+_TASK_LINE_PREFIX = f"{Colors.BLUE}│{Colors.ENDC} {Colors.DIM}+{Colors.ENDC} "
+
+# Answer-box rows factored so each color run spans whole rows instead of
+# toggling around every border glyph: bold blue opens once at the top
+# cap, plain blue stays open across the side borders of every row (the
+# content escapes and re-enters the run), and one reset closes the
+# block. Structural rows then carry no escapes at all, roughly halving
+# the ANSI sequences the terminal must parse per box.
+_ANSWER_TOP = f"\n{Colors.BOLD}{Colors.BLUE}╔{_BORDER_H80}╗\n"
+_ANSWER_TITLE = "║" + "ANSWER".center(78) + "║\n"
+_ANSWER_SEP = f"{Colors.ENDC}{Colors.BLUE}╠{_BORDER_H80}╣\n"
+_ANSWER_EMPTY = "║" + " " * 78 + "║\n"
+_ANSWER_ROW_OPEN = f"║{Colors.ENDC} "
+_ANSWER_ROW_CLOSE = f" {Colors.BLUE}║\n"
+_ANSWER_BOTTOM = f"{Colors.BOLD}╚{_BORDER_H80}╝{Colors.ENDC}\n\n"
+
+
+def _truncated(result: str) -> str:
+    """Cap a tool result at 150 chars, reusing the original when short."""
+    return result if len(result) <= 150 else result[:150] + "..."
+
+
 class UI:
     """
     Interactive user interface for displaying agent progress and results.
@@ -180,6 +494,14 @@ class UI:
     def __init__(self):
         """Initialize the UI with no active spinner."""
         self.current_spinner: Optional[Spinner] = None
+        # Under pipes/service managers stdout is block-buffered and
+        # progress output would only appear at exit; force line
+        # buffering once so every newline-terminated write shows up
+        # immediately without per-call flushes
+        try:
+            sys.stdout.reconfigure(line_buffering=True)
+        except Exception:
+            pass  # Not a TextIOWrapper (e.g. replaced stream in tests)
         
     @contextmanager
     def progress(self, message: str, success_message: str = ""):
@@ -203,20 +525,53 @@ class UI:
                 spinner.update_message("Processing data...")
                 process_data(data)
         """
-        spinner = Spinner(message, color=Colors.CYAN)
+        # Resolved up front, before any work runs under the spinner
+        default_success = success_message or message.replace("...", " ✓")
+        spinner = _spinner_pool.acquire(message, color=Colors.CYAN)
         self.current_spinner = spinner
         spinner.start()
         try:
             yield spinner
-            # Show success message or convert progress message
-            success_msg = success_message or message.replace("...", " ✓")
-            spinner.stop(success_msg, symbol="✓", symbol_color=Colors.GREEN)
+            spinner.stop(default_success, symbol="✓", symbol_color=Colors.GREEN)
         except Exception as e:
             spinner.stop(f"Failed: {str(e)}", symbol="✗", symbol_color=Colors.RED)
             raise
         finally:
             self.current_spinner = None
-    
+            _spinner_pool.release(spinner)
+
+    @asynccontextmanager
+    async def aprogress(self, message: str, success_message: str = ""):
+        """
+        Async variant of progress for callers inside an event loop.
+
+        The spinner runs as an asyncio task (see Spinner.start_async)
+        rather than a dedicated thread, with the same success/failure
+        handling as progress.
+
+        Args:
+            message (str): Message to display during progress
+            success_message (str): Optional success message on completion
+
+        Yields:
+            Spinner: The spinner instance for potential message updates
+        """
+        default_success = success_message or message.replace("...", " ✓")
+        spinner = _spinner_pool.acquire(message, color=Colors.CYAN)
+        self.current_spinner = spinner
+        task = spinner.start_async()
+        try:
+            yield spinner
+            spinner.stop(default_success, symbol="✓", symbol_color=Colors.GREEN)
+        except Exception as e:
+            spinner.stop(f"Failed: {str(e)}", symbol="✗", symbol_color=Colors.RED)
+            raise
+        finally:
+            if task is not None:
+                task.cancel()
+            self.current_spinner = None
+            _spinner_pool.release(spinner)
+
     def print_header(self, text: str):
         """
         Print a section header with decorative border styling.
@@ -224,7 +579,7 @@ class UI:
         Args:
             text (str): The header text to display
         """
-        print(f"\n{Colors.BOLD}{Colors.BLUE}╭─ {text}{Colors.ENDC}")
+        sys.stdout.write(_HDR_PREFIX + text + _HDR_SUFFIX)
     
     def print_user_query(self, query: str):
         """
@@ -236,7 +591,7 @@ class UI:
         Args:
             query (str): The user's input query
         """
-        print(f"\n{Colors.BOLD}{Colors.LIGHT_BLUE}You: {query}{Colors.ENDC}\n")
+        sys.stdout.write(_USER_PREFIX + query + _USER_SUFFIX)
     
     def print_task_list(self, tasks):
         """
@@ -251,14 +606,56 @@ class UI:
         if not tasks:
             return
         self.print_header("Planned Tasks")
-        for i, task in enumerate(tasks):
-            status = "+"  # Plus symbol indicates planned task
-            color = Colors.DIM
-            # Handle both dict objects and simple strings
-            desc = task.get('description', task) if hasattr(task, 'get') else task
-            print(f"{Colors.BLUE}│{Colors.ENDC} {color}{status}{Colors.ENDC} {desc}")
-        print(f"{Colors.BLUE}╰{'─' * 50}{Colors.ENDC}\n")
+        parts = []
+        for task in tasks:
+            # Handle both dict objects and simple strings. isinstance is a
+            # direct C-level type check, unlike hasattr which performs a
+            # full (and for strings, failing) attribute lookup per item
+            desc = task.get('description', task) if isinstance(task, dict) else task
+            parts.append(f"{_TASK_LINE_PREFIX}{desc}\n")
+        parts.append(f"{Colors.BLUE}╰{_BORDER_TASK}{Colors.ENDC}\n\n")
+        # One write for the whole box rather than a print per task
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
     
+    def print_task_list_strs(self, tasks):
+        """
+        Print a task list whose items are plain strings.
+
+        Specialized variant of print_task_list: no per-item type
+        dispatch, one joined write for the whole box.
+
+        Args:
+            tasks: List of task description strings
+        """
+        if not tasks:
+            return
+        self.print_header("Planned Tasks")
+        body = "\n".join(_TASK_LINE_PREFIX + desc for desc in tasks)
+        sys.stdout.write(f"{body}\n{Colors.BLUE}╰{_BORDER_TASK}{Colors.ENDC}\n\n")
+        sys.stdout.flush()
+
+    def print_task_list_dicts(self, tasks):
+        """
+        Print a task list whose items are dicts with a 'description' key.
+
+        Specialized variant of print_task_list: one joined write for the
+        whole box. Stray non-dict items are rendered as-is, so a mixed
+        list routed here never crashes on the description lookup.
+
+        Args:
+            tasks: List of task dicts
+        """
+        if not tasks:
+            return
+        self.print_header("Planned Tasks")
+        body = "\n".join(
+            f"{_TASK_LINE_PREFIX}{task.get('description', task) if isinstance(task, dict) else task}"
+            for task in tasks
+        )
+        sys.stdout.write(f"{body}\n{Colors.BLUE}╰{_BORDER_TASK}{Colors.ENDC}\n\n")
+        sys.stdout.flush()
+
     def print_task_start(self, task_desc: str):
         """
         Print a task start indicator with play symbol.
@@ -266,7 +663,7 @@ class UI:
         Args:
             task_desc (str): Description of the task being started
         """
-        print(f"\n{Colors.BOLD}{Colors.CYAN}▶ Task:{Colors.ENDC} {task_desc}")
+        sys.stdout.write(_TASK_START_PREFIX + task_desc + "\n")
     
     def print_task_done(self, task_desc: str):
         """
@@ -275,7 +672,7 @@ class UI:
         Args:
             task_desc (str): Description of the completed task
         """
-        print(f"{Colors.GREEN}  ✓ Completed{Colors.ENDC} {Colors.DIM}│ {task_desc}{Colors.ENDC}")
+        sys.stdout.write(_TASK_DONE_PREFIX + task_desc + _TASK_DONE_SUFFIX)
     
     def print_tool_params(self, params: str):
         """
@@ -284,19 +681,41 @@ class UI:
         Args:
             params (str): String representation of tool parameters
         """
-        params_display = f" {Colors.DIM}{params}{Colors.ENDC}" if params and len(params) > 0 else ""
-        print(f"  {Colors.MAGENTA}→{Colors.ENDC}  Parameters: {params_display}")
+        params_display = _DIM_OPEN + params + _DIM_CLOSE if params else ""
+        sys.stdout.write(_TOOL_PARAMS_PREFIX + params_display + "\n")
     
+    def print_tool_block(self, params: str, result: str):
+        """
+        Print tool parameters and result as one combined block.
+
+        Composes both lines in memory and issues a single write+flush,
+        halving the syscalls per tool invocation compared to calling
+        print_tool_params and print_tool_run separately.
+
+        Args:
+            params (str): String representation of tool parameters
+            result (str): String representation of tool result
+        """
+        params_display = _DIM_OPEN + params + _DIM_CLOSE if params else ""
+        result_display = f"{_DIM_OPEN}({_truncated(result)}){_DIM_CLOSE}" if result else ""
+        sys.stdout.write(
+            _TOOL_PARAMS_PREFIX + params_display + "\n"
+            + _TOOL_RUN_PREFIX + result_display + "\n"
+        )
+        sys.stdout.flush()
+
     def print_tool_run(self, result: str):
         """
         Print tool execution result with truncation for long outputs.
-        
+
         Args:
             result (str): String representation of tool result
         """
-        # Truncate long results to keep output manageable
-        result_display = f" {Colors.DIM}({result[:150]}...){Colors.ENDC}" if result and len(result) > 0 else ""
-        print(f"  {Colors.YELLOW}⚡{Colors.ENDC} Result: {result_display}")
+        if not result:
+            # Fast path: fully pre-assembled line, zero formatting work
+            sys.stdout.write(_TOOL_RUN_EMPTY)
+            return
+        sys.stdout.write(f"{_TOOL_RUN_PREFIX}{_DIM_OPEN}({_truncated(result)}){_DIM_CLOSE}\n")
     
     def print_answer(self, answer: str):
         """
@@ -309,43 +728,27 @@ class UI:
             answer (str): The answer text to display prominently
         """
         width = 80
-        
-        # Top border with double line style
-        print(f"\n{Colors.BOLD}{Colors.BLUE}╔{'═' * (width - 2)}╗{Colors.ENDC}")
-        
-        # Centered title
-        title = "ANSWER"
-        padding = (width - len(title) - 2) // 2
-        print(f"{Colors.BOLD}{Colors.BLUE}║{' ' * padding}{title}{' ' * (width - len(title) - padding - 2)}║{Colors.ENDC}")
-        
-        # Separator line
-        print(f"{Colors.BLUE}╠{'═' * (width - 2)}╣{Colors.ENDC}")
-        
-        # Answer content with proper line wrapping
-        print(f"{Colors.BLUE}║{Colors.ENDC}{' ' * (width - 2)}{Colors.BLUE}║{Colors.ENDC}")
+
+        # The whole box is collected in memory and emitted with one
+        # write+flush, instead of one print (and potential flush) per row.
+        # Top cap, centered title, separator and padding rows are fully
+        # precomputed; the blue border run opened at the top stays open
+        # across all of them (see the _ANSWER_* constants)
+        parts = [_ANSWER_TOP, _ANSWER_TITLE, _ANSWER_SEP, _ANSWER_EMPTY]
+
+        # Answer content with proper line wrapping. textwrap.wrap runs
+        # linearly in C-backed stdlib code, instead of the previous
+        # word-by-word concatenation that copied the growing line on
+        # every append (quadratic for long paragraphs)
         for line in answer.split('\n'):
-            if len(line) == 0:
-                # Empty line
-                print(f"{Colors.BLUE}║{Colors.ENDC}{' ' * (width - 2)}{Colors.BLUE}║{Colors.ENDC}")
-            else:
-                # Word wrap long lines to fit within box
-                words = line.split()
-                current_line = ""
-                for word in words:
-                    # Check if adding this word would exceed width
-                    if len(current_line) + len(word) + 1 <= width - 6:
-                        current_line += word + " "
-                    else:
-                        if current_line:
-                            print(f"{Colors.BLUE}║{Colors.ENDC} {current_line.ljust(width - 4)} {Colors.BLUE}║{Colors.ENDC}")
-                        current_line = word + " "
-                if current_line:
-                    print(f"{Colors.BLUE}║{Colors.ENDC} {current_line.ljust(width - 4)} {Colors.BLUE}║{Colors.ENDC}")
-        
-        print(f"{Colors.BLUE}║{Colors.ENDC}{' ' * (width - 2)}{Colors.BLUE}║{Colors.ENDC}")
-        
-        # Bottom border
-        print(f"{Colors.BOLD}{Colors.BLUE}╚{'═' * (width - 2)}╝{Colors.ENDC}\n")
+            for wrapped in textwrap.wrap(line, width=width - 6) or [""]:
+                parts.append(_ANSWER_ROW_OPEN + wrapped.ljust(width - 4) + _ANSWER_ROW_CLOSE)
+
+        parts.append(_ANSWER_EMPTY)
+        parts.append(_ANSWER_BOTTOM)
+
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
     
     def print_info(self, message: str):
         """
@@ -354,7 +757,7 @@ class UI:
         Args:
             message (str): The informational message to display
         """
-        print(f"{Colors.DIM}{message}{Colors.ENDC}")
+        sys.stdout.write(_INFO_PREFIX + message + _INFO_SUFFIX)
     
     def print_error(self, message: str):
         """
@@ -363,7 +766,7 @@ class UI:
         Args:
             message (str): The error message to display
         """
-        print(f"{Colors.RED}✗ Error:{Colors.ENDC} {message}")
+        sys.stdout.write(_ERROR_PREFIX + message + "\n")
     
     def print_warning(self, message: str):
         """
@@ -372,5 +775,26 @@ class UI:
         Args:
             message (str): The warning message to display
         """
-        print(f"{Colors.YELLOW}⚠ Warning:{Colors.ENDC} {message}")
+        sys.stdout.write(_WARNING_PREFIX + message + "\n")
 
+
+
+# Process-wide shared UI instance, created lazily by get_ui()
+_default_ui: Optional[UI] = None
+
+
+def get_ui() -> UI:
+    """
+    Return the shared UI instance, creating it on first use.
+
+    Components that previously constructed their own UI (Logger,
+    AgentDemo, the CLI) share one instance so construction happens
+    once per process and spinner state stays unified.
+
+    Returns:
+        UI: The process-wide UI instance
+    """
+    global _default_ui
+    if _default_ui is None:
+        _default_ui = UI()
+    return _default_ui